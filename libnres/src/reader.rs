@@ -101,7 +101,11 @@ fn get_element_data(file: &std::fs::File, element: &ListElement) -> Result<Vec<u
     let position = converter::u32_to_u64(element.position)?;
     let size = converter::u32_to_usize(element.size)?;
 
-    let mut reader = std::io::BufReader::new(file);
+    if size == 0 {
+        return Ok(Vec::new());
+    }
+
+    let mut reader = file;
     let mut buffer = vec![0u8; size];
 
     if let Err(error) = reader.seek(std::io::SeekFrom::Start(position)) {
@@ -115,15 +119,9 @@ fn get_element_data(file: &std::fs::File, element: &ListElement) -> Result<Vec<u
     Ok(buffer)
 }
 
-fn get_element_position(index: u32) -> Result<(usize, usize), ReaderError> {
-    let from = converter::u32_to_usize(index * LIST_ELEMENT_SIZE)?;
-    let to = converter::u32_to_usize((index * LIST_ELEMENT_SIZE) + LIST_ELEMENT_SIZE)?;
-    Ok((from, to))
-}
-
 fn get_file_header(file: &std::fs::File) -> Result<FileHeader, ReaderError> {
-    let mut reader = std::io::BufReader::new(file);
-    let mut buffer = vec![0u8; MINIMUM_FILE_SIZE as usize];
+    let mut reader = file;
+    let mut buffer = [0u8; MINIMUM_FILE_SIZE as usize];
 
     if let Err(error) = reader.seek(std::io::SeekFrom::Start(0)) {
         return Err(ReaderError::ReadFile(error));
@@ -140,7 +138,6 @@ fn get_file_header(file: &std::fs::File) -> Result<FileHeader, ReaderError> {
         type2: byteorder::LittleEndian::read_u32(&buffer[4..8]),
     };
 
-    buffer.clear();
     Ok(header)
 }
 
@@ -150,7 +147,7 @@ fn get_file_list(
     list: &mut Vec<ListElement>,
 ) -> Result<(), ReaderError> {
     let (start_position, list_size) = get_list_position(header)?;
-    let mut reader = std::io::BufReader::new(file);
+    let mut reader = file;
     let mut buffer = vec![0u8; list_size];
 
     if let Err(error) = reader.seek(std::io::SeekFrom::Start(start_position)) {
@@ -170,10 +167,9 @@ fn get_file_list(
         });
     }
 
-    for i in 0..(buffer_size / LIST_ELEMENT_SIZE) {
-        let (from, to) = get_element_position(i)?;
-        let chunk: &[u8] = &buffer[from..to];
+    list.reserve(converter::u32_to_usize(buffer_size / LIST_ELEMENT_SIZE)?);
 
+    for chunk in buffer.chunks_exact(LIST_ELEMENT_SIZE as usize) {
         let element = get_list_element(chunk)?;
         list.push(element);
     }
@@ -200,13 +196,8 @@ fn get_list_element(buffer: &[u8]) -> Result<ListElement, ReaderError> {
     let unknown1 = byteorder::LittleEndian::read_i32(&buffer[8..12]);
     let unknown2 = byteorder::LittleEndian::read_i32(&buffer[16..20]);
 
-    let extension = String::from_utf8_lossy(&buffer[0..4])
-        .trim_matches(char::from(0))
-        .to_string();
-
-    let name = String::from_utf8_lossy(&buffer[20..56])
-        .trim_matches(char::from(0))
-        .to_string();
+    let extension = get_string(&buffer[0..4]);
+    let name = get_string(&buffer[20..56]);
 
     Ok(ListElement {
         _unknown0: unknown0,
@@ -225,3 +216,17 @@ fn get_list_position(header: &FileHeader) -> Result<(u64, usize), ReaderError> {
     let size = converter::u32_to_usize(header.total * LIST_ELEMENT_SIZE)?;
     Ok((position, size))
 }
+
+fn get_string(buffer: &[u8]) -> String {
+    // Trim the zero padding before decoding, so only the value itself is converted
+    let start = buffer
+        .iter()
+        .position(|&byte| byte != 0)
+        .unwrap_or(buffer.len());
+    let end = buffer
+        .iter()
+        .rposition(|&byte| byte != 0)
+        .map_or(start, |index| index + 1);
+
+    String::from_utf8_lossy(&buffer[start..end]).into_owned()
+}
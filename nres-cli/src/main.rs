@@ -65,24 +65,38 @@ pub fn main() -> Result<()> {
 }
 
 fn command_check(_stdout: console::Term, file: String) -> Result<()> {
-    let file = std::fs::File::open(file).into_diagnostic()?;
+    let path = std::path::Path::new(&file);
+    let file = std::fs::File::open(path).into_diagnostic()?;
     let list = libnres::reader::get_list(&file).into_diagnostic()?;
     let tmp = tempdir::TempDir::new("nres").into_diagnostic()?;
     let bar = indicatif::ProgressBar::new(list.len() as u64);
 
     bar.set_style(get_bar_style()?);
 
-    for element in list {
-        bar.set_message(element.get_filename());
-
-        let path = tmp.path().join(element.get_filename());
-        let mut output = std::fs::File::create(path).into_diagnostic()?;
-        let mut buffer = libnres::reader::get_file(&file, &element).into_diagnostic()?;
+    let jobs = std::thread::available_parallelism().map_or(1, |value| value.get());
+    let chunk_size = list.len().div_ceil(jobs).max(1);
+
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = list
+            .chunks(chunk_size)
+            .enumerate()
+            .map(|(index, chunk)| {
+                // Entries may share a name, so every worker gets its own directory
+                let out = tmp.path().join(index.to_string());
+                let bar = &bar;
+                scope.spawn(move || check_elements(path, chunk, &out, bar))
+            })
+            .collect();
+
+        for handle in handles {
+            match handle.join() {
+                Err(error) => std::panic::resume_unwind(error),
+                Ok(result) => result?,
+            }
+        }
 
-        output.write_all(&buffer).into_diagnostic()?;
-        buffer.clear();
-        bar.inc(1);
-    }
+        Ok::<(), miette::Report>(())
+    })?;
 
     bar.finish();
 
@@ -92,14 +106,14 @@ fn command_check(_stdout: console::Term, file: String) -> Result<()> {
 fn command_debug(stdout: console::Term, file: String, name: Option<String>) -> Result<()> {
     let file = std::fs::File::open(file).into_diagnostic()?;
     let mut list = libnres::reader::get_list(&file).into_diagnostic()?;
+    let mut output = std::io::BufWriter::new(&stdout);
 
     let mut total_files_size: u32 = 0;
     let mut total_files_gap: u32 = 0;
-    let mut total_files: u32 = 0;
+    let total_files = list.len();
 
     for (index, item) in list.iter().enumerate() {
         total_files_size += item.size;
-        total_files += 1;
         let mut gap = 0;
 
         if index > 1 {
@@ -123,7 +137,7 @@ fn command_debug(stdout: console::Term, file: String, name: Option<String>) -> R
         }
 
         let text = format!("Index: {};\nGap: {};\nItem: {:#?};\n", index, gap, item);
-        stdout.write_line(&text).into_diagnostic()?;
+        writeln!(output, "{}", text).into_diagnostic()?;
     }
 
     let text = format!(
@@ -131,7 +145,8 @@ fn command_debug(stdout: console::Term, file: String, name: Option<String>) -> R
         total_files, total_files_gap, total_files_size
     );
 
-    stdout.write_line(&text).into_diagnostic()?;
+    writeln!(output, "{}", text).into_diagnostic()?;
+    output.flush().into_diagnostic()?;
 
     Ok(())
 }
@@ -144,9 +159,9 @@ fn command_extract(_stdout: console::Term, file: String, out: String, force: boo
     bar.set_style(get_bar_style()?);
 
     for element in list {
-        bar.set_message(element.get_filename());
-
-        let path = format!("{}/{}", out, element.get_filename());
+        let filename = element.get_filename();
+        let path = format!("{}/{}", out, filename);
+        bar.set_message(filename);
 
         if !force && is_exist_file(&path) {
             let message = format!("File \"{}\" exists. Overwrite it?", path);
@@ -176,9 +191,38 @@ fn command_extract(_stdout: console::Term, file: String, out: String, force: boo
 fn command_ls(stdout: console::Term, file: String) -> Result<()> {
     let file = std::fs::File::open(file).into_diagnostic()?;
     let list = libnres::reader::get_list(&file).into_diagnostic()?;
+    let mut output = std::io::BufWriter::new(&stdout);
 
     for element in list {
-        stdout.write_line(&element.name).into_diagnostic()?;
+        writeln!(output, "{}", element.name).into_diagnostic()?;
+    }
+
+    output.flush().into_diagnostic()?;
+
+    Ok(())
+}
+
+fn check_elements(
+    file: &std::path::Path,
+    list: &[libnres::reader::ListElement],
+    out: &std::path::Path,
+    bar: &indicatif::ProgressBar,
+) -> Result<()> {
+    // Each worker needs its own handle, since reading seeks the file position
+    let file = std::fs::File::open(file).into_diagnostic()?;
+    std::fs::create_dir(out).into_diagnostic()?;
+
+    for element in list {
+        let filename = element.get_filename();
+        let path = format!("{}/{}", out.display(), filename);
+        bar.set_message(filename);
+
+        let mut output = std::fs::File::create(path).into_diagnostic()?;
+        let mut buffer = libnres::reader::get_file(&file, element).into_diagnostic()?;
+
+        output.write_all(&buffer).into_diagnostic()?;
+        buffer.clear();
+        bar.inc(1);
     }
 
     Ok(())